@@ -91,6 +91,7 @@ class RobotCameramanArguments(Protocol):
     font: Path
     fontSize: int
     debug: bool
+    hide_non_target_candidates: bool
     select_target_strategy: str
     search_strategy: str
     rotatingSearchSpeed: int
@@ -188,6 +189,13 @@ def parse_arguments() -> RobotCameramanArguments:
     parser.add_argument('--debug',
                         action='store_true',
                         help="Enable debug logging")
+    parser.add_argument('--hide-non-target-candidates',
+                        action='store_true',
+                        help="Do not draw the detection candidates in the"
+                             " live view as long as no target is tracked,"
+                             " i.e. before a target is selected or after it"
+                             " is lost. A lost target is still drawn."
+                             " This saves drawing time per frame.")
     parser.add_argument('--search-strategy',
                         type=str, default='rotate',
                         help="If target is lost,"
@@ -550,7 +558,9 @@ manual_camera_speeds = max_speed_and_acceleration_updater.add(
 # noinspection PyUnboundLocalVariable
 cameraman = Cameraman(
     live_view=live_view,
-    annotator=ImageAnnotator(args.targetLabelId, labels, font),
+    annotator=ImageAnnotator(
+        args.targetLabelId, labels, font,
+        draw_non_target=not args.hide_non_target_candidates),
     detection_engine=detection_engine,
     destination=destination,
     mode_manager=cameraman_mode_manager,
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, NamedTuple, Callable
+from typing import Optional, Dict, NamedTuple, Callable, Tuple, Hashable
 
 import PIL.Image
 import PIL.ImageDraw
@@ -10,6 +10,12 @@ from robot_cameraman.color import Color
 from robot_cameraman.image_detection import DetectionCandidate
 from robot_cameraman.tracking import Destination
 
+_CANDIDATE_COLOR: Color = (255, 255, 255)
+_TARGET_COLOR: Color = (0, 255, 0)
+_LOST_TARGET_COLOR: Color = (255, 0, 0)
+_DESTINATION_COLOR: Color = (255, 0, 255)
+_DESTINATION_SIZE_BOX_COLOR: Color = (204, 0, 255)
+
 
 class _Target(NamedTuple):
     id: int
@@ -18,15 +24,20 @@ class _Target(NamedTuple):
 
 class ImageAnnotator:
     _target: Optional[_Target] = None
+    _overlay_key: Optional[Hashable] = None
+    _overlay: Optional[PIL.Image.Image] = None
+    _overlay_position: Tuple[int, int] = (0, 0)
 
     def __init__(
             self,
             target_label_id: int,
             labels: Dict[int, str],
-            font: FreeTypeFont) -> None:
+            font: FreeTypeFont,
+            draw_non_target: bool = True) -> None:
         self.target_label_id = target_label_id
         self.labels = labels
         self.font = font
+        self.draw_non_target = draw_non_target
 
     def annotate(
             self,
@@ -34,6 +45,47 @@ class ImageAnnotator:
             target_id: Optional[int],
             candidates: Dict[int, DetectionCandidate],
             mode_name: str) -> None:
+        if not self.draw_non_target and target_id not in candidates:
+            # No target is tracked. The target id is kept after the target is
+            # lost. Hence, only the mode name and the lost target are drawn.
+            draw = PIL.ImageDraw.Draw(image)
+            draw.text((0, 0), mode_name, font=self.font)
+            if self._target is not None:
+                self.draw_detection_candidate(image, draw, self._target.id,
+                                              self._target.candidate,
+                                              _LOST_TARGET_COLOR)
+            return
+        # In static scenes, successive frames get the same annotations.
+        # If they repeat, they are rendered once to a transparent overlay,
+        # which is pasted as long as the annotations do not change.
+        # The key is built for each frame, even if the detections change
+        # every frame. Its cost grows with the number of candidates, but it is
+        # small compared to drawing their boxes and labels.
+        key = (image.size, target_id, mode_name, tuple(
+            (candidate_id,
+             candidate.label_id,
+             round(candidate.score, 4),
+             candidate.bounding_box.coordinates)
+            for candidate_id, candidate in candidates.items()))
+        if key != self._overlay_key:
+            self._overlay_key = key
+            self._overlay = None
+            self._draw_annotations(image, target_id, candidates, mode_name)
+            return
+        if self._overlay is None:
+            overlay = PIL.Image.new('RGBA', image.size, (0, 0, 0, 0))
+            self._draw_annotations(overlay, target_id, candidates, mode_name)
+            bounding_box = overlay.getbbox() or (0, 0, 0, 0)
+            self._overlay = overlay.crop(bounding_box)
+            self._overlay_position = bounding_box[:2]
+        image.paste(self._overlay, self._overlay_position, self._overlay)
+
+    def _draw_annotations(
+            self,
+            image: PIL.Image.Image,
+            target_id: Optional[int],
+            candidates: Dict[int, DetectionCandidate],
+            mode_name: str) -> None:
         draw = PIL.ImageDraw.Draw(image)
         draw.text((0, 0), mode_name, font=self.font)
         # Iterate through result list. Note that results are already sorted by
@@ -41,20 +93,22 @@ class ImageAnnotator:
         # than the threshold are already removed.
         target_found = False
         for candidate_id, candidate in candidates.items():
-            color = (255, 255, 255)
+            color = _CANDIDATE_COLOR
             if candidate_id == target_id:
-                color = (0, 255, 0)
+                color = _TARGET_COLOR
                 target_found = True
                 self._target = _Target(target_id, candidate)
-            self.draw_detection_candidate(draw, candidate_id, candidate, color)
+            self.draw_detection_candidate(image, draw, candidate_id, candidate,
+                                          color)
         if self._target is None or target_found:
             return
-        self.draw_detection_candidate(draw, self._target.id,
+        self.draw_detection_candidate(image, draw, self._target.id,
                                       self._target.candidate,
-                                      (255, 0, 0))
+                                      _LOST_TARGET_COLOR)
 
     def draw_detection_candidate(
             self,
+            image: PIL.Image.Image,
             draw: ImageDraw,
             candidate_id: int,
             obj: DetectionCandidate,
@@ -63,8 +117,8 @@ class ImageAnnotator:
             is_draw_label: bool = True,
             is_draw_candidate_id: bool = True) -> None:
         box = obj.bounding_box
-        draw.rectangle(box.coordinates(), outline=color, width=outline_width)
-        draw_point(draw, box.center, color)
+        draw.rectangle(box.coordinates, outline=color, width=outline_width)
+        draw_point(image, box.center, color)
         if is_draw_label:
             # Annotate image with label and confidence score
             display_str = self.labels[obj.label_id] + ": " + str(
@@ -81,23 +135,42 @@ class ImageAnnotator:
 def draw_destination(
         image: PIL.Image.Image,
         destination: Destination,
-        color: Color = (255, 0, 255)) -> None:
+        color: Color = _DESTINATION_COLOR) -> None:
     draw = PIL.ImageDraw.Draw(image)
-    draw_point(draw, destination.center, color)
-    draw.rectangle(destination.box.coordinates(), outline=color)
-    draw.rectangle(destination.min_size_box.coordinates(),
-                   outline=(204, 0, 255))
-    draw.rectangle(destination.max_size_box.coordinates(),
-                   outline=(204, 0, 255))
+    draw_point(image, destination.center, color)
+    draw.rectangle(destination.box.coordinates, outline=color)
+    draw.rectangle(destination.min_size_box.coordinates,
+                   outline=_DESTINATION_SIZE_BOX_COLOR)
+    draw.rectangle(destination.max_size_box.coordinates,
+                   outline=_DESTINATION_SIZE_BOX_COLOR)
+
+
+_point_stamps: Dict[Tuple[Color, int], PIL.Image.Image] = {}
+
+
+def _get_point_stamp(color: Color, radius: int) -> PIL.Image.Image:
+    key = (color, radius)
+    stamp = _point_stamps.get(key)
+    if stamp is None:
+        diameter = 2 * radius
+        size = diameter + 1
+        stamp = PIL.Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        PIL.ImageDraw.Draw(stamp).ellipse((0, 0, diameter, diameter),
+                                          fill=color)
+        _point_stamps[key] = stamp
+    return stamp
 
 
 def draw_point(
-        draw: ImageDraw,
+        image: PIL.Image.Image,
         point: Point,
         color: Color,
         radius: int = 3) -> None:
+    # Points are drawn very often with only a few distinct colors and radii.
+    # Hence, each point is rendered only once and pasted afterwards.
     x, y = point
-    draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=color)
+    stamp = _get_point_stamp(color, radius)
+    image.paste(stamp, (int(x) - radius, int(y) - radius), stamp)
 
 
 AnnotateImage = Callable[[PIL.Image.Image], None]
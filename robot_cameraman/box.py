@@ -25,14 +25,14 @@ class Point:
 
 
 class Box(Protocol):
+    __slots__ = ()
+
     x: float
     y: float
     width: float
     height: float
     center: Point
-
-    def coordinates(self) -> tuple[float, float, float, float]:
-        return self.x, self.y, self.x + self.width, self.y + self.height
+    coordinates: tuple[float, float, float, float]
 
     @staticmethod
     def from_coordinates(x1: float, y1: float, x2: float, y2: float):
@@ -75,6 +75,7 @@ class Box(Protocol):
 
 
 class TwoPointsBox(Box):
+    __slots__ = ('x', 'y', 'width', 'height', 'center', 'coordinates')
 
     def __init__(self, x1: float, y1: float, x2: float, y2: float) -> None:
         self.x = x1
@@ -82,19 +83,29 @@ class TwoPointsBox(Box):
         self.width = abs(x2 - x1)
         self.height = abs(y2 - y1)
         self.center = Point(abs(x1 + x2) / 2, abs(y1 + y2) / 2)
+        self.coordinates = (x1, y1, x1 + self.width, y1 + self.height)
 
 
 class CenterSizeBox(Box):
+    __slots__ = ('x', 'y', 'width', 'height', 'center', 'coordinates')
 
     def __init__(self, center: Point, width: float, height: float) -> None:
-        half_width = width / 2
-        half_height = height / 2
-        x1 = center.x - half_width
-        x2 = center.x + half_width
-        y1 = center.y - half_height
-        y2 = center.y + half_height
-        self.x = x1
-        self.y = y1
         self.width = width
         self.height = height
         self.center = center
+        self._update_position()
+
+    def set_center(self, x: float, y: float) -> None:
+        self.center.set(x, y)
+        self._update_position()
+
+    def _update_position(self) -> None:
+        half_width = self.width / 2
+        half_height = self.height / 2
+        x1 = self.center.x - half_width
+        x2 = self.center.x + half_width
+        y1 = self.center.y - half_height
+        y2 = self.center.y + half_height
+        self.x = x1
+        self.y = y1
+        self.coordinates = (x1, y1, x2, y2)
@@ -3,11 +3,10 @@ from abc import abstractmethod, ABC
 from dataclasses import dataclass
 from enum import Enum, auto
 from logging import Logger
-from math import isclose
-from time import time
-from typing import List, Optional
+from math import copysign
+from time import monotonic_ns, sleep
+from typing import Dict, List, Optional, Tuple
 
-import numpy
 import serial
 from typing_extensions import Protocol
 
@@ -25,6 +24,8 @@ logger: Logger = logging.getLogger(__name__)
 
 
 class CameraController(Protocol):
+    __slots__ = ()
+
     @abstractmethod
     def start(self) -> None:
         raise NotImplementedError
@@ -43,7 +44,8 @@ class CameraController(Protocol):
 
 
 class SimpleCameraController(CameraController):
-    yaw_speed: float = 0
+    __slots__ = ('yaw_speed', '_gimbal')
+    yaw_speed: float
 
     def __init__(self, gimbal: Gimbal) -> None:
         self.yaw_speed = 0
@@ -62,7 +64,7 @@ class SimpleCameraController(CameraController):
         yaw_speed = camera_speeds.pan_speed
         if self.yaw_speed != yaw_speed:
             try:
-                logger.debug('rotate gimbal with speed {}'.format(yaw_speed))
+                logger.debug('rotate gimbal with speed %s', yaw_speed)
                 self._gimbal.control(yaw_speed=yaw_speed)
                 self.yaw_speed = yaw_speed
             except serial.serialutil.SerialException:
@@ -70,25 +72,34 @@ class SimpleCameraController(CameraController):
 
 
 class ElapsedTime:
-    _last_update_time: float
-
-    def __init__(self):
-        self._last_update_time: float = time()
-
-    def reset(self):
-        self._last_update_time = time()
-
-    def update(self) -> float:
-        current_time = time()
+    __slots__ = ('_last_update_time',)
+    # Nanoseconds of the monotonic clock. They are stored as integer to avoid
+    # rounding errors of float timestamps and converted to seconds on return.
+    _last_update_time: int
+
+    # The clock function is bound as default argument to avoid a global
+    # lookup, since these methods are called in each iteration of the
+    # control loop.
+    def __init__(self, _time=monotonic_ns):
+        self._last_update_time = _time()
+
+    def reset(self, _time=monotonic_ns):
+        self._last_update_time = _time()
+
+    def update(self, _time=monotonic_ns) -> float:
+        current_time = _time()
         elapsed_time = current_time - self._last_update_time
         self._last_update_time = current_time
-        return elapsed_time
+        return elapsed_time / 1e9
 
-    def get(self) -> float:
-        return time() - self._last_update_time
+    def get(self, _time=monotonic_ns) -> float:
+        return (_time() - self._last_update_time) / 1e9
 
 
 class SpeedManager:
+    __slots__ = ('_elapsed_time', 'acceleration_per_second', 'target_speed',
+                 'current_speed')
+
     def __init__(self, acceleration_per_second: float = 400,
                  elapsed_time: ElapsedTime = None):
         if elapsed_time is None:
@@ -104,19 +115,47 @@ class SpeedManager:
     def is_target_speed_reached(self):
         return self.current_speed == self.target_speed
 
+    def get_time_to_reach_target_speed(self) -> float:
+        delta_speed = abs(self.target_speed - self.current_speed)
+        if delta_speed == 0:
+            return 0
+        if self.acceleration_per_second <= 0:
+            return float('inf')
+        return delta_speed / self.acceleration_per_second
+
     def update(self) -> float:
+        if self.current_speed == self.target_speed:
+            # Nothing to accelerate, but elapsed time has to be updated anyway.
+            self._elapsed_time.reset()
+            return self.current_speed
         elapsed_time = self._elapsed_time.update()
         delta_speed = self.target_speed - self.current_speed
-        acceleration = min(self.acceleration_per_second * elapsed_time,
-                           abs(delta_speed))
-        self.current_speed += numpy.sign(delta_speed) * acceleration
+        acceleration = self.acceleration_per_second * elapsed_time
+        if acceleration >= abs(delta_speed):
+            # Assign the target speed instead of adding the delta, which might
+            # not result in the target speed due to floating point rounding.
+            # Otherwise, the target speed might never be reached exactly.
+            self.current_speed = self.target_speed
+        else:
+            self.current_speed += copysign(acceleration, delta_speed)
         return self.current_speed
 
 
 class SmoothCameraController(CameraController):
+    __slots__ = ('_gimbal', '_camera_manager', '_rotate_speed_manager',
+                 '_tilt_speed_manager', '_old_zoom_speed', '_sent_speeds')
     _rotate_speed_manager: SpeedManager
     _tilt_speed_manager: SpeedManager
-    _old_zoom_speed: ZoomSpeed = ZoomSpeed.ZOOM_STOPPED
+    _old_zoom_speed: ZoomSpeed
+    _sent_speeds: Optional[Tuple[float, float]]
+    stop_update_interval: float = 1 / 15
+    _zoom_methods: Dict[ZoomSpeed, Tuple[str, str]] = {
+        ZoomSpeed.ZOOM_IN_FAST: ('zoom in fast', 'zoom_in_fast'),
+        ZoomSpeed.ZOOM_IN_SLOW: ('zoom in slow', 'zoom_in_fast'),
+        ZoomSpeed.ZOOM_STOPPED: ('zoom stop', 'zoom_stop'),
+        ZoomSpeed.ZOOM_OUT_SLOW: ('zoom out slow', 'zoom_out_slow'),
+        ZoomSpeed.ZOOM_OUT_FAST: ('zoom out fast', 'zoom_out_fast'),
+    }
 
     def __init__(self,
                  gimbal: Gimbal,
@@ -127,10 +166,13 @@ class SmoothCameraController(CameraController):
         self._camera_manager = camera_manager
         self._rotate_speed_manager = rotate_speed_manager
         self._tilt_speed_manager = tilt_speed_manager
+        self._old_zoom_speed = ZoomSpeed.ZOOM_STOPPED
+        self._sent_speeds = None
 
     def start(self) -> None:
         self._rotate_speed_manager.reset()
         self._tilt_speed_manager.reset()
+        self._sent_speeds = None
 
     def update(self, camera_speeds: CameraSpeeds) -> None:
         logger.debug('new speeds: pan %5d, tilt %5d',
@@ -144,37 +186,40 @@ class SmoothCameraController(CameraController):
             logger.debug('current gimbal accelerations are: pan %5d, tilt %5d',
                          self._rotate_speed_manager.acceleration_per_second,
                          self._tilt_speed_manager.acceleration_per_second)
-            self._gimbal.control(yaw_speed=self._rotate_speed_manager.update(),
-                                 pitch_speed=self._tilt_speed_manager.update())
+            speeds = (self._rotate_speed_manager.update(),
+                      self._tilt_speed_manager.update())
+            # The gimbal keeps its speeds. Hence, they are only sent if they
+            # changed, which saves a round trip on the serial connection.
+            if speeds != self._sent_speeds:
+                yaw_speed, pitch_speed = speeds
+                self._gimbal.control(yaw_speed=yaw_speed,
+                                     pitch_speed=pitch_speed)
+                self._sent_speeds = speeds
             logger.debug('current gimbal speeds are: pan %5d, tilt %5d',
                          self._rotate_speed_manager.current_speed,
                          self._tilt_speed_manager.current_speed)
         except serial.serialutil.SerialException as e:
-            logger.error(f'failed to control gimbal: {e}')
+            logger.error('failed to control gimbal: %s', e)
             self._rotate_speed_manager.current_speed = old_speed
             self._tilt_speed_manager.current_speed = old_tilt_speed
+            self._sent_speeds = None
+        # The camera keeps zooming with the last zoom speed. Hence, it only
+        # has to be controlled if the zoom speed changes.
+        if camera_speeds.zoom_speed is not self._old_zoom_speed:
+            self._update_zoom(camera_speeds.zoom_speed)
+
+    def _update_zoom(self, zoom_speed: ZoomSpeed) -> None:
         try:
             camera = self._camera_manager.camera
             if camera is not None:
-                logger.debug('zoom: new {: >5}, old {: >5}'.format(
-                    camera_speeds.zoom_speed, self._old_zoom_speed))
-                if camera_speeds.zoom_speed is not self._old_zoom_speed:
-                    if camera_speeds.zoom_speed is ZoomSpeed.ZOOM_IN_FAST:
-                        logger.debug('zoom in fast')
-                        camera.zoom_in_fast()
-                    elif camera_speeds.zoom_speed is ZoomSpeed.ZOOM_IN_SLOW:
-                        logger.debug('zoom in slow')
-                        camera.zoom_in_fast()
-                    elif camera_speeds.zoom_speed is ZoomSpeed.ZOOM_STOPPED:
-                        logger.debug('zoom stop')
-                        camera.zoom_stop()
-                    elif camera_speeds.zoom_speed is ZoomSpeed.ZOOM_OUT_SLOW:
-                        logger.debug('zoom out slow')
-                        camera.zoom_out_slow()
-                    elif camera_speeds.zoom_speed is ZoomSpeed.ZOOM_OUT_FAST:
-                        logger.debug('zoom out fast')
-                        camera.zoom_out_fast()
-                self._old_zoom_speed = camera_speeds.zoom_speed
+                logger.debug('zoom: new %5d, old %5d',
+                             zoom_speed, self._old_zoom_speed)
+                zoom_method = self._zoom_methods.get(zoom_speed)
+                if zoom_method is not None:
+                    message, method_name = zoom_method
+                    logger.debug(message)
+                    getattr(camera, method_name)()
+                self._old_zoom_speed = zoom_speed
         except Exception as e:
             logger.error('failed to zoom camera: %s', e)
 
@@ -183,8 +228,16 @@ class SmoothCameraController(CameraController):
                 or self._tilt_speed_manager.current_speed != 0)
 
     def stop(self, camera_speeds: CameraSpeeds) -> None:
+        # The time it takes to decelerate is known. Hence, do not busy wait,
+        # but sleep till the next update is due or the camera has stopped.
         while self.is_camera_moving():
             self.update(camera_speeds)
+            if not self.is_camera_moving():
+                break
+            time_to_stop = max(
+                self._rotate_speed_manager.get_time_to_reach_target_speed(),
+                self._tilt_speed_manager.get_time_to_reach_target_speed())
+            sleep(min(self.stop_update_interval, time_to_stop))
 
 
 class CameraZoomLimitController(Protocol):
@@ -209,8 +262,8 @@ class CameraZoomRatioLimitController(CameraZoomLimitController):
     def update(self, camera_speeds: CameraSpeeds) -> None:
         if self.zoom_ratio is None:
             return
-        logger.debug(
-            f'check if current zoom ratio {self.zoom_ratio} reached limit')
+        logger.debug('check if current zoom ratio %s reached limit',
+                     self.zoom_ratio)
         if (self._is_heading_towards_min(camera_speeds.zoom_speed)
                 and self.is_min_reached()):
             logger.debug('min zoom ratio reached, zoom speed is set to 0')
@@ -283,13 +336,20 @@ class PredictiveCameraZoomRatioLimitController(CameraZoomRatioLimitController):
             #   (object tracking vs. color tracking)
             time_to_stop = t + t_up + 0.25
             logger.debug(
-                f'heading towards max zoom ratio {self.max_zoom_ratio},'
-                f' time since last update={time_since_last_update},'
-                f' current={self.zoom_ratio},'
-                f' time since current has been reached={t},'
-                f' next={next_zoom_step.zoom_ratio},'
-                f' min stop time={next_zoom_step.min_stop_zoom_in_time},'
-                f' time to stop={time_to_stop}')
+                'heading towards max zoom ratio %s,'
+                ' time since last update=%s,'
+                ' current=%s,'
+                ' time since current has been reached=%s,'
+                ' next=%s,'
+                ' min stop time=%s,'
+                ' time to stop=%s',
+                self.max_zoom_ratio,
+                time_since_last_update,
+                self.zoom_ratio,
+                t,
+                next_zoom_step.zoom_ratio,
+                next_zoom_step.min_stop_zoom_in_time,
+                time_to_stop)
             if (next_zoom_step.zoom_ratio == self.max_zoom_ratio
                     and next_zoom_step.min_stop_zoom_in_time <= time_to_stop):
                 logger.debug('max zoom ratio is predicted to be reached soon,'
@@ -316,8 +376,8 @@ class CameraZoomIndexLimitController(CameraZoomLimitController):
     def update(self, camera_speeds: CameraSpeeds) -> None:
         if self.zoom_index is None:
             return
-        logger.debug(
-            f'check if current zoom index {self.zoom_index} reached limit')
+        logger.debug('check if current zoom index %s reached limit',
+                     self.zoom_index)
         if (self._is_heading_towards_min(camera_speeds.zoom_speed)
                 and self.is_min_reached()):
             logger.debug('min zoom index reached, zoom speed is set to 0')
@@ -362,14 +422,17 @@ class CameraAngleLimitController:
         self._current_tilt_angle = angles.tilt_angle
 
     def update(self, camera_speeds: CameraSpeeds) -> None:
+        # Limits are usually not configured. Then there is nothing to check.
+        if ((self.min_pan_angle is None or self.max_pan_angle is None)
+                and (self.min_tilt_angle is None
+                     or self.max_tilt_angle is None)):
+            return
         if (self._current_pan_angle is None
                 or self._current_tilt_angle is None):
             logger.debug('current angles are not set yet')
             return
-        logger.debug(', '.join((
-            f"pan angle: {self._current_pan_angle:4.1f}",
-            f"tilt angle: {self._current_tilt_angle:4.1f}",
-        )))
+        logger.debug('pan angle: %4.1f, tilt angle: %4.1f',
+                     self._current_pan_angle, self._current_tilt_angle)
 
         # Since camera might rotate full circle, a single limit could be
         # reached rotating clockwise or counter clockwise. It is unrealistic
@@ -383,49 +446,43 @@ class CameraAngleLimitController:
         # They define a range, in which the camera stops,
         # i.e. the camera stops after a limit is passed.
         # The camera may only move to the closer limit to exit this range.
-        if (self.min_pan_angle is not None
-                and self.max_pan_angle is not None
-                and is_angle_between(
-                    left=self.min_pan_angle,
-                    angle=self._current_pan_angle,
-                    right=self.max_pan_angle,
-                    clockwise=False)):
-            min_pan_delta = get_delta_angle_clockwise(
-                left=self._current_pan_angle, right=self.min_pan_angle)
-            max_pan_delta = get_delta_angle_counter_clockwise(
-                left=self._current_pan_angle, right=self.max_pan_angle)
-            if min_pan_delta < max_pan_delta:
-                if camera_speeds.pan_speed < 0:
-                    logger.debug(
-                        'min pan angle reached, pan speed is set to 0')
-                    camera_speeds.pan_speed = 0
-            else:
-                if camera_speeds.pan_speed > 0:
-                    logger.debug(
-                        'max pan angle reached, pan speed is set to 0')
-                    camera_speeds.pan_speed = 0
-
-        if (self.min_tilt_angle is not None
-                and self.max_tilt_angle is not None
-                and is_angle_between(
-                    left=self.min_tilt_angle,
-                    angle=self._current_tilt_angle,
-                    right=self.max_tilt_angle,
-                    clockwise=False)):
-            min_tilt_delta = get_delta_angle_clockwise(
-                left=self._current_tilt_angle, right=self.min_tilt_angle)
-            max_tilt_delta = get_delta_angle_counter_clockwise(
-                left=self._current_tilt_angle, right=self.max_tilt_angle)
-            if min_tilt_delta < max_tilt_delta:
-                if camera_speeds.tilt_speed < 0:
-                    logger.debug(
-                        'min tilt angle reached, tilt speed is set to 0')
-                    camera_speeds.tilt_speed = 0
-            else:
-                if camera_speeds.tilt_speed > 0:
-                    logger.debug(
-                        'max tilt angle reached, tilt speed is set to 0')
-                    camera_speeds.tilt_speed = 0
+        pan_speed = self._limit_speed(
+            self._current_pan_angle, self.min_pan_angle, self.max_pan_angle,
+            camera_speeds.pan_speed)
+        if pan_speed != camera_speeds.pan_speed:
+            logger.debug('pan angle limit reached, pan speed %s is set to 0',
+                         camera_speeds.pan_speed)
+            camera_speeds.pan_speed = pan_speed
+        tilt_speed = self._limit_speed(
+            self._current_tilt_angle, self.min_tilt_angle,
+            self.max_tilt_angle, camera_speeds.tilt_speed)
+        if tilt_speed != camera_speeds.tilt_speed:
+            logger.debug('tilt angle limit reached, tilt speed %s is set to 0',
+                         camera_speeds.tilt_speed)
+            camera_speeds.tilt_speed = tilt_speed
+
+    @staticmethod
+    def _limit_speed(
+            angle: float,
+            min_angle: Optional[float],
+            max_angle: Optional[float],
+            speed: float) -> float:
+        # The checks of is_angle_between, get_delta_angle_clockwise and
+        # get_delta_angle_counter_clockwise are inlined, since this method is
+        # called for each axis in each iteration of the control loop.
+        if (min_angle is None
+                or max_angle is None
+                or not (min_angle >= angle >= max_angle
+                        if min_angle >= max_angle
+                        else min_angle >= angle or angle >= max_angle)):
+            return speed
+        min_delta = (min_angle - angle if angle <= min_angle
+                     else (min_angle - angle) % 360)
+        max_delta = (angle - max_angle if angle >= max_angle
+                     else (angle - max_angle) % 360)
+        if min_delta < max_delta:
+            return 0 if speed < 0 else speed
+        return 0 if speed > 0 else speed
 
 
 @dataclass()
@@ -489,25 +546,38 @@ class PathOfMotionCameraController(ABC):
     def __init__(self):
         self._path: List[PointOfMotion] = []
         self._current_point_index = 0
+        # The next point is looked up on each update. Hence, it is cached and
+        # only updated if the path or the current point changes.
+        self._next_point: Optional[PointOfMotion] = None
 
     def has_points(self):
         return bool(self._path)
 
     def add_point(self, point: PointOfMotion) -> None:
         self._path.append(point)
+        self._update_next_point()
 
     def current_point(self):
         return self._path[self._current_point_index]
 
     def get_next_point(self):
-        return self._path[self._current_point_index + 1]
+        if self._next_point is None:
+            raise IndexError('path has no next point')
+        return self._next_point
 
     def has_next_point(self):
-        return (self._current_point_index + 1) < len(self._path)
+        return self._next_point is not None
 
     def next_point(self):
         self._current_point_index = min(self._current_point_index + 1,
                                         len(self._path))
+        self._update_next_point()
+
+    def _update_next_point(self):
+        next_point_index = self._current_point_index + 1
+        self._next_point = (self._path[next_point_index]
+                            if next_point_index < len(self._path)
+                            else None)
 
     def is_end_of_path_reached(self):
         return self._current_point_index >= len(self._path)
@@ -547,6 +617,7 @@ class BaseCamPathOfMotionCameraController(PathOfMotionCameraController):
         self._target_speed_calculator = target_speed_calculator
         self._state = self._State.STOPPED
         self._previous_point: Optional[PointOfMotion] = None
+        self._sent_control: Optional[Tuple[float, float, float, float]] = None
 
     def next_point(self):
         self._previous_point = self.current_point()
@@ -555,6 +626,7 @@ class BaseCamPathOfMotionCameraController(PathOfMotionCameraController):
     def start(self):
         self._reset_speed_managers()
         self._state = self._State.STARTED
+        self._sent_control = None
 
     def update(self, camera_speeds: CameraSpeeds) -> None:
         assert self._state is not self._State.STOPPED
@@ -564,24 +636,24 @@ class BaseCamPathOfMotionCameraController(PathOfMotionCameraController):
         _log_angles(angles)
         camera_speeds.pan_speed = to_degree_per_sec(angles.target_speed_3)
         camera_speeds.tilt_speed = to_degree_per_sec(angles.target_speed_2)
+        pan_angle = to_degree(angles.target_angle_3)
+        tilt_angle = to_degree(angles.target_angle_2)
         if self._state is self._State.STARTED:
             self._state = self._State.RUNNING
-            if self._is_current_point_reached(angles):
+            if self._is_current_point_reached(pan_angle, tilt_angle):
                 if self.has_next_point():
                     self.next_point()
                 else:
                     self._stop()
                     return
             else:
-                pan_angle = to_degree(angles.target_angle_3)
-                tilt_angle = to_degree(angles.target_angle_2)
                 self._previous_point = PointOfMotion(pan_angle=pan_angle,
                                                      tilt_angle=tilt_angle)
             assert self._previous_point is not None
             self._update_target_speeds(camera_speeds, self._previous_point)
             self._update_speed_managers()
             self._move_gimbal_to_current_point()
-        elif self._is_current_point_reached(angles):
+        elif self._is_current_point_reached(pan_angle, tilt_angle):
             logger.debug('move to next point')
             if self.has_next_point():
                 self.next_point()
@@ -640,14 +712,12 @@ class BaseCamPathOfMotionCameraController(PathOfMotionCameraController):
         camera_state = CameraState(speeds=camera_speeds,
                                    pan_angle=previous_point.pan_angle,
                                    tilt_angle=previous_point.tilt_angle)
-        logger.debug(f'camera state {camera_state}')
-        logger.debug(f'next point {next_point}')
-        next_but_one_point = \
-            self.get_next_point() if self.has_next_point() else None
-        logger.debug(f'next but one point {next_but_one_point}')
+        logger.debug('camera state %s', camera_state)
+        logger.debug('next point %s', next_point)
+        logger.debug('next but one point %s', self._next_point)
         target_speeds = self._target_speed_calculator.calculate(
             camera_state, next_point)
-        logger.debug(f'target speeds {target_speeds}')
+        logger.debug('target speeds %s', target_speeds)
         self._rotate_speed_manager.target_speed = target_speeds.pan_speed
         self._tilt_speed_manager.target_speed = target_speeds.tilt_speed
 
@@ -655,13 +725,12 @@ class BaseCamPathOfMotionCameraController(PathOfMotionCameraController):
         return (self._rotate_speed_manager.is_target_speed_reached()
                 and self._tilt_speed_manager.is_target_speed_reached())
 
-    def _is_current_point_reached(self, angles: GetAnglesInCmd):
-        next_point = self.get_next_point() if self.has_next_point() else None
+    def _is_current_point_reached(self, pan_angle: float, tilt_angle: float):
         return is_current_point_reached(
-            pan_angle=to_degree(angles.target_angle_3),
-            tilt_angle=to_degree(angles.target_angle_2),
+            pan_angle=pan_angle,
+            tilt_angle=tilt_angle,
             current_target=self.current_point(),
-            next_target=next_point)
+            next_target=self._next_point)
 
     @classmethod
     def _current_speed(cls, speed_manager: SpeedManager):
@@ -677,8 +746,8 @@ class BaseCamPathOfMotionCameraController(PathOfMotionCameraController):
             current_point = self.current_point()
             pan_angle = current_point.pan_angle
             tilt_angle = current_point.tilt_angle
-            if self.has_next_point():
-                next_point = self.get_next_point()
+            next_point = self._next_point
+            if next_point is not None:
                 # Do not stop at intermediate/current point if the next point
                 # is in the same direction.
                 if current_point.pan_clockwise == next_point.pan_clockwise:
@@ -687,29 +756,30 @@ class BaseCamPathOfMotionCameraController(PathOfMotionCameraController):
                     tilt_angle = next_point.tilt_angle
             yaw_speed = self._current_speed(self._rotate_speed_manager)
             pitch_speed = self._current_speed(self._tilt_speed_manager)
-            logger.debug(' '.join((
-                f'pan to {pan_angle}',
-                f'with {self._rotate_speed_manager.current_speed}°/s,',
-                f'tilt to {tilt_angle}',
-                f'with {self._tilt_speed_manager.current_speed}°/s',
-            )))
+            # The gimbal keeps moving to the last target angles with the last
+            # speeds. Hence, the same command does not need to be sent again.
+            control = (yaw_speed, pan_angle, pitch_speed, tilt_angle)
+            if control == self._sent_control:
+                return
+            logger.debug('pan to %s with %s°/s, tilt to %s with %s°/s',
+                         pan_angle, self._rotate_speed_manager.current_speed,
+                         tilt_angle, self._tilt_speed_manager.current_speed)
             self._gimbal.control(
                 yaw_mode=ControlMode.angle, yaw_speed=yaw_speed,
                 yaw_angle=pan_angle,
                 pitch_mode=ControlMode.angle, pitch_speed=pitch_speed,
                 pitch_angle=tilt_angle)
+            self._sent_control = control
 
 
 def _log_angles(angles: GetAnglesInCmd):
-    logger.debug(' '.join((
-        'pan:',
-        f'{to_degree(angles.target_angle_3):6.2f}°',
-        f'{to_degree_per_sec(angles.target_speed_3):6.2f}°/s',
-        ' ' * 4,
-        'tilt:',
-        f'{to_degree(angles.target_angle_2):6.2f}°',
-        f'{to_degree_per_sec(angles.target_speed_2):6.2f}°/s',
-    )))
+    # The units are only converted if the message is logged.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('pan: %6.2f° %6.2f°/s      tilt: %6.2f° %6.2f°/s',
+                     to_degree(angles.target_angle_3),
+                     to_degree_per_sec(angles.target_speed_3),
+                     to_degree(angles.target_angle_2),
+                     to_degree_per_sec(angles.target_speed_2))
 
 
 def is_current_point_reached(
@@ -717,10 +787,14 @@ def is_current_point_reached(
         tilt_angle: float,
         current_target: PointOfMotion,
         next_target: Optional[PointOfMotion]) -> bool:
-    next_pan_angle = getattr(next_target, 'pan_angle', None)
-    next_pan_clockwise = getattr(next_target, 'pan_clockwise', None)
-    next_tilt_angle = getattr(next_target, 'tilt_angle', None)
-    next_tilt_clockwise = getattr(next_target, 'tilt_clockwise', None)
+    if next_target is None:
+        next_pan_angle = next_pan_clockwise = None
+        next_tilt_angle = next_tilt_clockwise = None
+    else:
+        next_pan_angle = next_target.pan_angle
+        next_pan_clockwise = next_target.pan_clockwise
+        next_tilt_angle = next_target.tilt_angle
+        next_tilt_clockwise = next_target.tilt_clockwise
     pan_reached = is_current_angle_reached(
         current_angle=pan_angle,
         current_target_angle=current_target.pan_angle,
@@ -734,9 +808,9 @@ def is_current_point_reached(
         next_target_angle=next_tilt_angle,
         next_target_rotate_clockwise=next_tilt_clockwise)
     if pan_reached:
-        logger.debug(f'pan angle reached {current_target.pan_angle:.2f}°')
+        logger.debug('pan angle reached %.2f°', current_target.pan_angle)
     if tilt_reached:
-        logger.debug(f'tilt angle reached {current_target.tilt_angle:.2f}°')
+        logger.debug('tilt angle reached %.2f°', current_target.tilt_angle)
     return pan_reached and tilt_reached
 
 
@@ -765,11 +839,10 @@ def is_close_angle(a: float, b: float, abs_tol: float) -> bool:
         maximum difference for being considered "close", regardless of the
         magnitude of the input values
     """
-    if isclose(a, b, abs_tol=abs_tol):
-        return True
-    a_distance_to_overstep = abs(360 - a) % 360
-    b_distance_to_overstep = abs(360 - b) % 360
-    return a_distance_to_overstep + b_distance_to_overstep <= abs_tol
+    # Gimbal angles are not normalized (e.g. -300° or 400°). Hence, the
+    # distance is computed modulo 360 and then the shorter arc is taken.
+    distance = abs(a - b) % 360
+    return min(distance, 360 - distance) <= abs_tol
 
 
 def is_angle_between(
@@ -787,7 +860,7 @@ def is_angle_between(
 
 
 def _main():
-    from time import sleep
+    from time import monotonic, sleep
     from robot_cameraman.gimbal import create_simple_bgc_gimbal
     logging.basicConfig(
         level=logging.DEBUG,
@@ -810,8 +883,14 @@ def _main():
                                        time=3))
     camera_speeds = CameraSpeeds()
     controller.start()
+    update_interval = 1 / 15
+    next_update_time = monotonic()
     while not controller.is_end_of_path_reached():
-        sleep(1 / 15)
+        # Updates are scheduled at fixed times. Otherwise, the duration of
+        # each update (serial round trips) would add to the interval. After an
+        # overrun, the schedule is resumed from now instead of catching up.
+        next_update_time = max(next_update_time + update_interval, monotonic())
+        sleep(max(0.0, next_update_time - monotonic()))
         controller.update(camera_speeds)
 
 
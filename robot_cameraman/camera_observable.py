@@ -2,6 +2,7 @@ import csv
 import datetime
 import logging
 from dataclasses import fields
+from operator import attrgetter
 from pathlib import Path
 
 from panasonic_camera.live_view import ExHeader, ExHeader1, ExHeader2, ExHeader8
@@ -18,19 +19,20 @@ class PanasonicCameraObservable:
         self._event_emitter = event_emitter
 
     def on_ex_header(self, ex_header: ExHeader):
-        if (isinstance(ex_header, ExHeader1)
-                or isinstance(ex_header, ExHeader2)):
+        # Subclasses (e.g. ExHeader8) contain the zoom as well. Hence, the type
+        # is checked with isinstance and not looked up by exact type.
+        if isinstance(ex_header, (ExHeader1, ExHeader2)):
             zoom_index = ex_header.b
-            logger.debug(f"zoom index {zoom_index}")
+            logger.debug('zoom index %s', zoom_index)
             self._event_emitter.emit(Event.ZOOM_INDEX, zoom_index)
             # Zoom ratio is encoded as integer,
             # e.g 1.5x is encoded as 15.
             # Convert it to float:
             zoom_ratio = ex_header.zoomRatio / 10
-            logger.debug(f"zoom ratio {zoom_ratio}")
+            logger.debug('zoom ratio %s', zoom_ratio)
             self._event_emitter.emit(Event.ZOOM_RATIO, zoom_ratio)
             focal_length = zoom_ratio * self.min_focal_length
-            logger.debug(f"focal length {focal_length}")
+            logger.debug('focal length %s', focal_length)
             self._event_emitter.emit(Event.FOCAL_LENGTH, focal_length)
 
 
@@ -48,14 +50,14 @@ class ExHeaderToCsvWriter:
         #     'u',
         #     'A']
         self._csv_writer.writerow(self._ex_header_attribute_names)
+        self._get_row = attrgetter(*self._ex_header_attribute_names)
         self._previous_row = None
 
     def on_ex_header(self, ex_header: ExHeader):
         if isinstance(ex_header, ExHeader8):
-            row = [getattr(ex_header, attribute_name)
-                   for attribute_name in self._ex_header_attribute_names]
+            row = self._get_row(ex_header)
             if self._previous_row != row:
                 self._previous_row = row
                 self._csv_writer.writerow(row)
         else:
-            logger.error(f'unexpected header type: {ex_header}')
+            logger.error('unexpected header type: %s', ex_header)
@@ -40,6 +40,7 @@ class CameramanModeManager:
         self._mode_name_lock = RLock()
         self._mode_name = None
         self.mode_name = 'manual'
+        self._is_gimbal_controlled_by_angle = False
         # TODO searching does not start if used as initial mode, since current
         #  angles have not been set on StaticSearchTargetStrategy yet
         # self.mode_name = 'searching'
@@ -94,6 +95,14 @@ class CameramanModeManager:
                     or self.are_limits_applied_in_manual_mode):
                 self._camera_zoom_limit_controller.update(self._camera_speeds)
                 self._camera_angle_limit_controller.update(self._camera_speeds)
+            if self._is_gimbal_controlled_by_angle:
+                # The gimbal has been controlled without the camera controller.
+                # Hence, the camera controller has to forget the speeds it
+                # sent last. Otherwise, it might not send a speed of 0 to stop
+                # the gimbal. This is done in the thread that updates the
+                # camera controller to not interfere with an ongoing update.
+                self._is_gimbal_controlled_by_angle = False
+                self._camera_controller.start()
             self._camera_controller.update(self._camera_speeds)
 
     def _read_gimbal_angles(self):
@@ -151,3 +160,4 @@ class CameramanModeManager:
             yaw_mode=ControlMode.angle, yaw_speed=100, yaw_angle=pan_angle,
             pitch_mode=ControlMode.angle, pitch_speed=100,
             pitch_angle=tilt_angle)
+        self._is_gimbal_controlled_by_angle = True
@@ -31,6 +31,7 @@ class EventEmitter:
         return self._listeners.setdefault(event, [])
 
     def emit(self, event: Event, value):
-        property_listeners = self._get_event_listeners(event)
-        for listener in property_listeners:
+        # Events are emitted for each frame. Hence, no empty list of
+        # listeners is created for events without listeners.
+        for listener in self._listeners.get(event, ()):
             listener(value)
@@ -9,7 +9,7 @@
 
 import argparse
 import os
-from typing import Dict, List
+from typing import Dict, Sequence
 
 import PIL.Image
 import PIL.ImageDraw
@@ -31,7 +31,7 @@ ARGS = None
 
 def annotate(
         image: PIL.Image.Image,
-        inferenceResults: List[DetectionCandidate],
+        inferenceResults: Sequence[DetectionCandidate],
         elapsedMs: float,
         labels: Dict[int, str],
         font: PIL.ImageFont.FreeTypeFont) -> None:
@@ -39,17 +39,14 @@ def annotate(
     # confidence score (highest to lowest) and records with a lower score
     # than the threshold are already removed.
     result_size = len(inferenceResults)
+    # Prepare image for drawing
+    draw = PIL.ImageDraw.Draw(image)
     for idx, obj in enumerate(inferenceResults):
-
-        # Prepare image for drawing
-        draw = PIL.ImageDraw.Draw(image)
-
         # Prepare boundary box
         box = obj.bounding_box
 
-        # Draw rectangle to desired thickness
-        for x in range(0, 4):
-            draw.rectangle(box.coordinates(), outline=(255, 255, 0))
+        # Draw rectangle
+        draw.rectangle(box.coordinates, outline=(255, 255, 0))
 
         # Annotate image with label and confidence score
         display_str = labels[obj.label_id] + ": " + str(
@@ -199,11 +199,13 @@ class ObjectTracker:
     def update(self, inference_results: List[DetectionCandidate]) \
             -> Dict[int, DetectionCandidate]:
         centroid_to_inference_result = dict()
-        centroids = np.zeros((len(inference_results), 2), dtype="int")
-        for i, r in enumerate(inference_results):
+        centroid_list = []
+        for r in inference_results:
             c = (int(r.bounding_box.center.x), int(r.bounding_box.center.y))
-            centroids[i] = c
+            centroid_list.append(c)
             centroid_to_inference_result[c] = r
+        # create the array at once instead of assigning row by row
+        centroids = np.array(centroid_list, dtype="int").reshape(-1, 2)
         objects = self._centroid_tracker.update(centroids, inference_results)
         return {object_id: centroid_to_inference_result[(x, y)]
                 for object_id, (x, y) in objects.items()
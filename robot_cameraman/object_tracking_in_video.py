@@ -67,15 +67,15 @@ class ColoredCandidatesImageAnnotator(ImageAnnotator):
             for candidate_id, candidate in previous_candidates.items():
                 color = get_color(candidate_id, (255, 255, 255))
                 # noinspection PyTypeChecker
-                self.draw_detection_candidate(draw, candidate_id, candidate,
-                                              (*color, 60),
+                self.draw_detection_candidate(image, draw, candidate_id,
+                                              candidate, (*color, 60),
                                               outline_width=8,
                                               is_draw_label=False,
                                               is_draw_candidate_id=False)
         for candidate_id, candidate in candidates.items():
             color = get_color(candidate_id, (255, 255, 255))
-            self.draw_detection_candidate(draw, candidate_id, candidate, color,
-                                          outline_width=8)
+            self.draw_detection_candidate(image, draw, candidate_id,
+                                          candidate, color, outline_width=8)
 
     def draw_candidate_id(self, draw: ImageDraw, center, candidate_id: str):
         super().draw_candidate_id(draw, center,
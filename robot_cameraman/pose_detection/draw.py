@@ -24,9 +24,9 @@ class PoseDraw:
         for pose in poses:
             logger.debug(f'draw pose: {pose}')
             self.draw_edges(draw, pose)
-            self.draw_key_points(draw, pose)
+            self.draw_key_points(image, pose)
             # bounding_box = pose.get_bounding_box()
-            # draw.rectangle(bounding_box.coordinates(),
+            # draw.rectangle(bounding_box.coordinates,
             #                outline=(255, 0, 0))
 
     def draw_edges(self, draw, pose):
@@ -35,10 +35,10 @@ class PoseDraw:
                       width=3,
                       fill=(255, 255, 0))
 
-    def draw_key_points(self, draw: ImageDraw, pose: Pose):
+    def draw_key_points(self, image: PIL.Image.Image, pose: Pose):
         for kp in pose:
             self._key_point_center.set(x=kp.x, y=kp.y)
-            draw_point(draw,
+            draw_point(image,
                        self._key_point_center,
                        color=(0, 255, 0),
                        radius=self.keypoint_radius)
@@ -169,7 +169,7 @@ class SimulatorRenderer:
             outline=(204, 0, 255),
             radius=camera_radius)
 
-        self._draw_distances(draw)
+        self._draw_distances(result, draw)
         return result
 
     def _draw_world_x_history(self, draw, history: deque, outline, radius):
@@ -194,21 +194,21 @@ class SimulatorRenderer:
             outline=outline,
             width=4)
 
-    def _draw_distances(self, draw: ImageDraw):
+    def _draw_distances(self, image: Image.Image, draw: ImageDraw):
         self._draw_distance(
-            draw, self._simulator.target.speed, color=(0, 200, 0))
+            image, self._simulator.target.speed, color=(0, 200, 0))
         distance = self._simulator.get_distance()
-        self._draw_distance(draw, distance, color=(255, 0, 255))
+        self._draw_distance(image, distance, color=(255, 0, 255))
         history_length = len(self._simulator.distance_history)
         for i, d in enumerate(self._simulator.distance_history, start=1):
             alpha = int(i * 255 / history_length)
             self._draw_distance_circle(draw, d, color=(204, 0, 255, alpha))
 
-    def _draw_distance(self, draw, distance, color):
+    def _draw_distance(self, image: Image.Image, distance, color):
         x_pos = self.get_x_pos_of_distance(distance)
         radius = 15
         draw_point(
-            draw,
+            image,
             Point(x_pos, self._number_line_position.y - 5 - radius),
             color=color,
             radius=radius)
@@ -9,7 +9,7 @@ import numpy
 from typing_extensions import Protocol
 
 from robot_cameraman.angle import get_delta_angle_clockwise, get_angle_distance
-from robot_cameraman.box import Box, TwoPointsBox, Point
+from robot_cameraman.box import Box, CenterSizeBox, Point
 from robot_cameraman.camera_controller import CameraZoomLimitController, \
     CameraAngleLimitController, CameraZoomIndexLimitController, \
     CameraZoomRatioLimitController
@@ -33,22 +33,19 @@ class Destination:
         self.variance = variance
         x_padding = 0.3 * width
         y_padding = 0.2 * height
-        self.min_size_box = TwoPointsBox(0, 0, 0, 0)
-        self.max_size_box = TwoPointsBox(0, 0, 0, 0)
-        self.max_size_box.width = width - 2 * x_padding
-        self.max_size_box.height = height - 2 * y_padding
-        self.min_size_box.width = self.max_size_box.width - 2 * self.variance
-        self.min_size_box.height = self.max_size_box.height - 2 * self.variance
-        self.update_size_box_center(x, y)
+        max_size_box_width = width - 2 * x_padding
+        max_size_box_height = height - 2 * y_padding
+        self.max_size_box = CenterSizeBox(Point(x, y),
+                                          max_size_box_width,
+                                          max_size_box_height)
+        self.min_size_box = CenterSizeBox(
+            Point(x, y),
+            max_size_box_width - 2 * self.variance,
+            max_size_box_height - 2 * self.variance)
 
     def update_size_box_center(self, x: float, y: float):
-        self.max_size_box.x = x - self.max_size_box.width / 2
-        self.max_size_box.y = y - self.max_size_box.height / 2
-        self.max_size_box.center.set(x, y)
-
-        self.min_size_box.x = x - self.min_size_box.width / 2
-        self.min_size_box.y = y - self.min_size_box.height / 2
-        self.min_size_box.center.set(x, y)
+        self.max_size_box.set_center(x, y)
+        self.min_size_box.set_center(x, y)
 
 
 class TrackingStrategy(Protocol):
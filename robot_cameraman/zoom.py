@@ -1,10 +1,8 @@
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, List, Dict
 
-import more_itertools
-
 
 @dataclass()
 class ZoomStep:
@@ -37,23 +35,28 @@ class ZoomStep:
 @dataclass()
 class ZoomSteps:
     _zoom_steps: List[ZoomStep]
+    # Zoom steps are looked up by zoom ratio in each update of the zoom limit
+    # controller. Hence, the index of the first step of each zoom ratio is
+    # stored to avoid a linear search.
+    _zoom_step_indices: Dict[float, int] = field(repr=False, compare=False)
 
     def __init__(self, zoom_steps: List[ZoomStep]) -> None:
         self._zoom_steps = zoom_steps
+        self._zoom_step_indices = {}
+        for i, zoom_step in enumerate(zoom_steps):
+            self._zoom_step_indices.setdefault(zoom_step.zoom_ratio, i)
 
     def get_by_zoom_ratio(self, zoom_ratio: float):
-        def has_zoom_ratio(zoom_step: ZoomStep):
-            return zoom_step.zoom_ratio == zoom_ratio
-
-        return more_itertools.first_true(
-            self._zoom_steps, None, has_zoom_ratio)
+        i = self._zoom_step_indices.get(zoom_ratio)
+        return None if i is None else self._zoom_steps[i]
 
     def get_next_greater(self, zoom_step: ZoomStep):
-        try:
-            i = self._zoom_steps.index(zoom_step)
-            return self._zoom_steps[i + 1]
-        except (ValueError, IndexError):
+        if zoom_step is None:
+            return None
+        i = self._zoom_step_indices.get(zoom_step.zoom_ratio)
+        if i is None or i + 1 >= len(self._zoom_steps):
             return None
+        return self._zoom_steps[i + 1]
 
     def get_min_zoom_ratio(self) -> float:
         return self._zoom_steps[0].zoom_ratio
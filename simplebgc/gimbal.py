@@ -1,4 +1,5 @@
 from enum import IntEnum
+from functools import lru_cache
 from logging import getLogger
 
 from serial import Serial
@@ -26,15 +27,39 @@ class ControlMode(IntEnum):
     # TODO flags
 
 
+# CMD_GET_ANGLES has no payload. Hence, its message is always the same.
+_GET_ANGLES_MESSAGE = pack_message(create_message(CMD_GET_ANGLES))
+
+
+@lru_cache(maxsize=512)
+def _pack_control_message(control_data: ControlOutCmd) -> bytes:
+    # Gimbals are controlled with the same few commands again and again
+    # (e.g. same speed or target angle). Hence, packed messages are cached.
+    return pack_message(create_message(CMD_CONTROL, control_data.pack()))
+
+
+def _enable_low_latency_mode(connection: Serial) -> None:
+    # USB serial adapters (e.g. FTDI) buffer received data for up to 16 ms by
+    # default. Each command waits for a response of the gimbal. Hence, this
+    # delay would limit the rate of the control loop.
+    try:
+        connection.set_low_latency_mode(True)
+    except (AttributeError, NotImplementedError, ValueError) as e:
+        # only supported on Linux and by some serial drivers. Pyserial does not
+        # provide it on Windows and raises NotImplementedError on other POSIX.
+        logger.warning('low latency mode of serial port not enabled: %s', e)
+
+
 class Gimbal:
 
     def __init__(self, connection: Serial = None) -> None:
         if connection is None:
             connection = Serial('/dev/ttyUSB0', baudrate=115200, timeout=10)
+            _enable_low_latency_mode(connection)
         self._connection = connection
 
     def send_message(self, message: Message):
-        logger.debug(f'send message: {message}')
+        logger.debug('send message: %s', message)
         self._connection.write(pack_message(message))
 
     def control(
@@ -58,9 +83,8 @@ class Gimbal:
             yaw_mode=int(yaw_mode),
             yaw_speed=from_degree_per_sec(yaw_speed),
             yaw_angle=from_degree(yaw_angle))
-        logger.debug(f'send control cmd: {control_data}')
-        message = create_message(CMD_CONTROL, control_data.pack())
-        self.send_message(message)
+        logger.debug('send control cmd: %s', control_data)
+        self._connection.write(_pack_control_message(control_data))
         confirmation: Message = read_message(self._connection, 1)
         assert confirmation.command_id == CMD_CONFIRM, \
             f'expected confirmation, but received command with ID' \
@@ -72,7 +96,7 @@ class Gimbal:
                      yaw_mode=ControlMode.no_control)
 
     def get_angles(self) -> GetAnglesInCmd:
-        self.send_message(create_message(CMD_GET_ANGLES))
+        self._connection.write(_GET_ANGLES_MESSAGE)
         cmd = read_cmd(self._connection)
         assert cmd.id == CMD_GET_ANGLES
         return parse_cmd(cmd)
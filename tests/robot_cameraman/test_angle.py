@@ -7,6 +7,8 @@ def test_get_delta_angle_clockwise():
     assert get_delta_angle_clockwise(left=6, right=0) == 354
     assert get_delta_angle_clockwise(left=0, right=0) == 0
     assert get_delta_angle_clockwise(left=30, right=35) == 5
+    assert get_delta_angle_clockwise(left=370, right=5) == 355
+    assert get_delta_angle_clockwise(left=-5, right=-10) == 355
 
 
 def test_get_delta_angle_counter_clockwise():
@@ -14,6 +16,8 @@ def test_get_delta_angle_counter_clockwise():
     assert get_delta_angle_counter_clockwise(left=6, right=0) == 6
     assert get_delta_angle_counter_clockwise(left=0, right=0) == 0
     assert get_delta_angle_counter_clockwise(left=35, right=30) == 5
+    assert get_delta_angle_counter_clockwise(left=5, right=370) == 355
+    assert get_delta_angle_counter_clockwise(left=-10, right=-5) == 355
 
 
 def test_get_angle_distance():
@@ -0,0 +1,92 @@
+import PIL.Image
+import PIL.ImageDraw
+import PIL.ImageFont
+import pytest
+
+from robot_cameraman.annotation import draw_point, ImageAnnotator
+from robot_cameraman.box import Point, Box
+from robot_cameraman.image_detection import DetectionCandidate
+
+
+@pytest.mark.parametrize('radius', [1, 3, 15])
+def test_draw_point_equals_ellipse(radius):
+    x, y = 20, 17
+    color = (255, 0, 255)
+    expected = PIL.Image.new('RGB', (40, 40))
+    PIL.ImageDraw.Draw(expected).ellipse(
+        (x - radius, y - radius, x + radius, y + radius), fill=color)
+    image = PIL.Image.new('RGB', (40, 40))
+    draw_point(image, Point(x, y), color, radius)
+    assert image.tobytes() == expected.tobytes()
+
+
+class TestImageAnnotator:
+    @pytest.fixture()
+    def background(self):
+        return PIL.Image.new('RGB', (120, 100), (40, 80, 120))
+
+    @pytest.fixture()
+    def candidates(self):
+        return {
+            1: DetectionCandidate(label_id=0, score=0.9,
+                                  bounding_box=Box.from_coordinates(
+                                      10, 10, 50, 60)),
+            2: DetectionCandidate(label_id=0, score=0.7,
+                                  bounding_box=Box.from_coordinates(
+                                      60, 20, 110, 90)),
+        }
+
+    @staticmethod
+    def create_annotator(draw_non_target: bool = True):
+        return ImageAnnotator(target_label_id=0,
+                              labels={0: 'person'},
+                              font=PIL.ImageFont.load_default(),
+                              draw_non_target=draw_non_target)
+
+    @staticmethod
+    def annotate(annotator, background, target_id, candidates):
+        image = background.copy()
+        annotator.annotate(image, target_id, candidates, 'mode')
+        return image.tobytes()
+
+    def test_cached_annotations_equal_drawn_annotations(
+            self, background, candidates):
+        annotator = self.create_annotator()
+        # first frame is drawn, second frame renders the overlay,
+        # third frame reuses the overlay
+        frames = [self.annotate(annotator, background, 1, candidates)
+                  for _ in range(3)]
+        assert frames[0] != background.tobytes()
+        assert frames[1] == frames[0]
+        assert frames[2] == frames[0]
+
+    def test_changed_annotations_invalidate_cache(
+            self, background, candidates):
+        annotator = self.create_annotator()
+        for _ in range(3):
+            self.annotate(annotator, background, 1, candidates)
+        candidates[2] = DetectionCandidate(
+            label_id=0, score=0.7,
+            bounding_box=Box.from_coordinates(65, 20, 115, 90))
+        expected = self.annotate(
+            self.create_annotator(), background, 1, candidates)
+        for _ in range(3):
+            assert self.annotate(
+                annotator, background, 1, candidates) == expected
+
+    def test_hide_candidates_if_target_is_lost(
+            self, background, candidates):
+        annotator = self.create_annotator(draw_non_target=False)
+        self.annotate(annotator, background, 1, candidates)
+        del candidates[1]
+        # the cameraman keeps the id of a lost target
+        image = PIL.Image.frombytes(
+            'RGB', background.size,
+            self.annotate(annotator, background, 1, candidates))
+        candidate_box = (60, 20, 111, 91)
+        assert (image.crop(candidate_box).tobytes()
+                == background.crop(candidate_box).tobytes())
+        target_box = (10, 10, 51, 61)
+        assert (image.crop(target_box).tobytes()
+                != background.crop(target_box).tobytes())
+        assert image.getpixel((10, 30)) == (255, 0, 0)
@@ -1,12 +1,16 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
 import pytest
 
+import robot_cameraman.camera_controller
+from robot_cameraman.angle import get_delta_angle_clockwise, \
+    get_delta_angle_counter_clockwise
 from robot_cameraman.camera_controller import \
     BaseCamPathOfMotionCameraController, PointOfMotion, SpeedManager, \
     ElapsedTime, CameraState, PointOfMotionTargetSpeedCalculator, \
-    is_current_point_reached, is_angle_between, CameraAngleLimitController
-from robot_cameraman.camera_speeds import CameraSpeeds
+    is_current_point_reached, is_angle_between, CameraAngleLimitController, \
+    SmoothCameraController, is_close_angle
+from robot_cameraman.camera_speeds import CameraSpeeds, ZoomSpeed
 from robot_cameraman.gimbal import Angles
 from simplebgc.commands import GetAnglesInCmd
 from simplebgc.gimbal import Gimbal, ControlMode
@@ -48,6 +52,17 @@ def create_speed_manager_mock():
         return sm.current_speed
 
     sm.update = Mock(side_effect=update)
+
+    def get_time_to_reach_target_speed():
+        delta_speed = abs(sm.target_speed - sm.current_speed)
+        if delta_speed == 0:
+            return 0
+        if sm.acceleration_per_second <= 0:
+            return float('inf')
+        return delta_speed / sm.acceleration_per_second
+
+    sm.get_time_to_reach_target_speed = Mock(
+        side_effect=get_time_to_reach_target_speed)
     return sm
 
 
@@ -55,6 +70,14 @@ def should_not_be_called_mock(name: str):
     return Mock(side_effect=RuntimeError(f'{name} should not be called'))
 
 
+class TestElapsedTime:
+    def test_returns_seconds_of_nanosecond_clock(self):
+        elapsed_time = ElapsedTime(_time=lambda: 2_000_000_000)
+        assert elapsed_time.get(_time=lambda: 2_250_000_000) == 0.25
+        assert elapsed_time.update(_time=lambda: 3_500_000_000) == 1.5
+        assert elapsed_time.get(_time=lambda: 3_500_000_000) == 0
+
+
 class TestSpeedManager:
     @pytest.fixture()
     def acceleration(self):
@@ -79,12 +102,44 @@ class TestSpeedManager:
         speed_manager.reset()
         assert elapsed_time.reset.call_count == 1
 
+    def test_update_if_target_speed_is_reached(
+            self, speed_manager, elapsed_time):
+        speed_manager.current_speed = speed_manager.target_speed = 3
+        assert speed_manager.update() == 3
+        assert elapsed_time.reset.call_count == 1
+        assert elapsed_time.update.call_count == 0
+
+    def test_update_reaches_target_speed_exactly(self, speed_manager):
+        # 0.7 + (0.1 - 0.7) is not 0.1 due to floating point rounding
+        speed_manager.current_speed = 0.7
+        speed_manager.target_speed = 0.1
+        assert speed_manager.update() == 0.1
+        assert speed_manager.is_target_speed_reached()
+
     def test_speed_manager(self, speed_manager):
         self.run_test_of_speed_manager(speed_manager)
 
     def test_speed_manager_mock(self):
         self.run_test_of_speed_manager(create_speed_manager_mock())
 
+    def test_get_time_to_reach_target_speed(self, speed_manager):
+        self.run_test_of_get_time_to_reach_target_speed(speed_manager)
+
+    def test_get_time_to_reach_target_speed_of_mock(self):
+        self.run_test_of_get_time_to_reach_target_speed(
+            create_speed_manager_mock())
+
+    @staticmethod
+    def run_test_of_get_time_to_reach_target_speed(speed_manager):
+        speed_manager.acceleration_per_second = 4
+        assert speed_manager.get_time_to_reach_target_speed() == 0
+        speed_manager.current_speed = 6
+        assert speed_manager.get_time_to_reach_target_speed() == 1.5
+        speed_manager.target_speed = 8
+        assert speed_manager.get_time_to_reach_target_speed() == 0.5
+        speed_manager.acceleration_per_second = 0
+        assert speed_manager.get_time_to_reach_target_speed() == float('inf')
+
     @staticmethod
     def run_test_of_speed_manager(speed_manager):
         speed_manager.acceleration_per_second = 0
@@ -127,6 +182,82 @@ class TestSpeedManager:
         assert speed_manager.is_target_speed_reached()
 
 
+class TestSmoothCameraController:
+    @pytest.fixture()
+    def gimbal(self):
+        # mock serial connection to avoid error, because port can not be opened
+        return Mock(spec=Gimbal(Mock()))
+
+    @pytest.fixture()
+    def camera_manager(self):
+        camera_manager = Mock()
+        camera_manager.camera = None
+        return camera_manager
+
+    @pytest.fixture()
+    def rotate_speed_manager(self):
+        return create_speed_manager_mock()
+
+    @pytest.fixture()
+    def controller(self, gimbal, camera_manager, rotate_speed_manager):
+        return SmoothCameraController(
+            gimbal,
+            camera_manager,
+            rotate_speed_manager=rotate_speed_manager,
+            tilt_speed_manager=create_speed_manager_mock())
+
+    def test_send_speeds_only_if_changed(
+            self, controller, gimbal, rotate_speed_manager):
+        rotate_speed_manager.acceleration_per_second = 1
+        controller.start()
+        controller.update(CameraSpeeds(pan_speed=0, tilt_speed=0))
+        controller.update(CameraSpeeds(pan_speed=0, tilt_speed=0))
+        assert gimbal.control.call_count == 1
+        controller.update(CameraSpeeds(pan_speed=2, tilt_speed=0))
+        gimbal.control.assert_called_with(yaw_speed=1, pitch_speed=0)
+        controller.update(CameraSpeeds(pan_speed=2, tilt_speed=0))
+        gimbal.control.assert_called_with(yaw_speed=2, pitch_speed=0)
+        controller.update(CameraSpeeds(pan_speed=2, tilt_speed=0))
+        assert gimbal.control.call_count == 3
+
+    def test_zoom_only_if_zoom_speed_changed(
+            self, controller, camera_manager):
+        camera_manager.camera = Mock()
+        controller.update(CameraSpeeds(zoom_speed=ZoomSpeed.ZOOM_OUT_FAST))
+        controller.update(CameraSpeeds(zoom_speed=ZoomSpeed.ZOOM_OUT_FAST))
+        assert camera_manager.camera.zoom_out_fast.call_count == 1
+        controller.update(CameraSpeeds(zoom_speed=ZoomSpeed.ZOOM_STOPPED))
+        controller.update(CameraSpeeds(zoom_speed=ZoomSpeed.ZOOM_STOPPED))
+        assert camera_manager.camera.zoom_stop.call_count == 1
+
+    def test_zoom_when_camera_is_available(self, controller, camera_manager):
+        controller.update(CameraSpeeds(zoom_speed=ZoomSpeed.ZOOM_OUT_FAST))
+        camera_manager.camera = Mock()
+        controller.update(CameraSpeeds(zoom_speed=ZoomSpeed.ZOOM_OUT_FAST))
+        assert camera_manager.camera.zoom_out_fast.call_count == 1
+
+    def test_stop_sleeps_between_updates(
+            self, controller, gimbal, rotate_speed_manager, monkeypatch):
+        sleep = Mock()
+        monkeypatch.setattr(robot_cameraman.camera_controller, 'sleep', sleep)
+        rotate_speed_manager.acceleration_per_second = 20
+        rotate_speed_manager.current_speed = 50
+        controller.start()
+        controller.stop(CameraSpeeds())
+        assert rotate_speed_manager.current_speed == 0
+        assert rotate_speed_manager.update.call_count == 3
+        assert sleep.call_args_list == [
+            call(controller.stop_update_interval),
+            call(controller.stop_update_interval)]
+
+    def test_send_speeds_again_after_start(self, controller, gimbal):
+        controller.start()
+        controller.update(CameraSpeeds(pan_speed=0, tilt_speed=0))
+        controller.start()
+        controller.update(CameraSpeeds(pan_speed=0, tilt_speed=0))
+        assert gimbal.control.call_count == 2
+
+
 class TestBaseCamPathOfMotionCameraController:
     @pytest.fixture()
     def gimbal(self):
@@ -659,6 +790,41 @@ class TestBaseCamPathOfMotionCameraController:
             pitch_speed=10,
             pitch_angle=second_point.tilt_angle)
 
+    def test_same_control_command_is_not_sent_again(
+            self, controller, camera_speeds, gimbal, zero_point,
+            rotate_speed_manager, tilt_speed_manager, target_speed_calculator,
+            max_speeds):
+        gimbal.control = Mock()
+        target_speed_calculator.calculate = Mock(return_value=max_speeds)
+        # Gimbal speeds are at least 1°/s. Hence, the speeds sent to the
+        # gimbal do not change in the first two updates.
+        rotate_speed_manager.acceleration_per_second = 0.5
+        tilt_speed_manager.acceleration_per_second = 0.5
+        second_point = PointOfMotion(pan_angle=100, tilt_angle=20, time=2)
+        controller.add_point(zero_point)
+        controller.add_point(second_point)
+        controller.start()
+        gimbal.get_angles = Mock(
+            return_value=get_angles_in_cmd(pan_angle=300, pan_speed=0,
+                                           tilt_angle=354, tilt_speed=0))
+
+        controller.update(camera_speeds)
+        gimbal.control.assert_called_once_with(
+            yaw_mode=ControlMode.angle,
+            yaw_speed=1,
+            yaw_angle=second_point.pan_angle,
+            pitch_mode=ControlMode.angle,
+            pitch_speed=1,
+            pitch_angle=second_point.tilt_angle)
+        gimbal.control.reset_mock()
+
+        controller.update(camera_speeds)
+        assert rotate_speed_manager.current_speed == 1
+        assert gimbal.control.call_count == 0
+
+        controller.update(camera_speeds)
+        assert gimbal.control.call_count == 1
+
 
 class TestPointOfMotionTargetSpeedCalculator:
     @pytest.fixture()
@@ -820,6 +986,26 @@ class TestIsCurrentPointReached:
                                         current_target=c, next_target=n)
 
 
+class TestIsCloseAngle:
+    def test_is_close_angle(self):
+        assert is_close_angle(10, 10.04, abs_tol=0.05)
+        assert not is_close_angle(10, 10.06, abs_tol=0.05)
+
+    def test_is_close_angle_across_360(self):
+        assert is_close_angle(0, 359.96, abs_tol=0.05)
+        assert is_close_angle(359.99, 0.01, abs_tol=0.05)
+        assert is_close_angle(0.01, 359.99, abs_tol=0.05)
+        assert not is_close_angle(1, 359, abs_tol=0.05)
+
+    def test_is_close_angle_of_angles_not_in_0_to_360(self):
+        assert is_close_angle(-0.02, 359.99, abs_tol=0.05)
+        assert is_close_angle(370, 10.01, abs_tol=0.05)
+        assert is_close_angle(-350, 10, abs_tol=0.05)
+        assert not is_close_angle(100, -300, abs_tol=0.05)
+        assert not is_close_angle(10, -355, abs_tol=0.05)
+        assert not is_close_angle(400, 10, abs_tol=0.05)
+
+
 class TestIsAngleBetween:
     def test_is_angle_between(self):
         assert is_angle_between(left=0, angle=10, right=20, clockwise=True)
@@ -972,3 +1158,33 @@ class TestCameraAngleLimitController:
         controller.max_tilt_angle = 5.0
         controller.update(camera_speeds)
         assert camera_speeds.tilt_speed == -42
+
+    def test_limit_equals_angle_functions(
+            self, controller: CameraAngleLimitController):
+        # update inlines is_angle_between and get_delta_angle_*
+        limits = [(0, 15), (15, 0), (345, 0), (350, 5), (90, 270), (0, 0)]
+        for min_angle, max_angle in limits:
+            controller.min_pan_angle = min_angle
+            controller.max_pan_angle = max_angle
+            controller.min_tilt_angle = min_angle
+            controller.max_tilt_angle = max_angle
+            for angle in range(0, 360, 5):
+                for speed in (-42, 0, 42):
+                    expected_speed = speed
+                    if is_angle_between(left=min_angle, angle=angle,
+                                        right=max_angle, clockwise=False):
+                        min_delta = get_delta_angle_clockwise(
+                            left=angle, right=min_angle)
+                        max_delta = get_delta_angle_counter_clockwise(
+                            left=angle, right=max_angle)
+                        if (speed < 0 if min_delta < max_delta
+                                else speed > 0):
+                            expected_speed = 0
+                    controller.update_current_angles(
+                        Angles(pan_angle=angle, pan_speed=0,
+                               tilt_angle=angle, tilt_speed=0))
+                    camera_speeds = CameraSpeeds(pan_speed=speed,
+                                                 tilt_speed=speed)
+                    controller.update(camera_speeds)
+                    assert camera_speeds.pan_speed == expected_speed
+                    assert camera_speeds.tilt_speed == expected_speed
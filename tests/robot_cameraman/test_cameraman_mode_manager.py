@@ -0,0 +1,75 @@
+from unittest.mock import Mock, call
+
+import pytest
+
+from robot_cameraman.camera_controller import SmoothCameraController, \
+    SpeedManager
+from robot_cameraman.cameraman_mode_manager import CameramanModeManager
+from robot_cameraman.events import EventEmitter
+from simplebgc.commands import GetAnglesInCmd
+from simplebgc.gimbal import Gimbal
+
+
+class TestCameramanModeManager:
+    @pytest.fixture()
+    def gimbal(self):
+        # mock serial connection to avoid error, because port can not be opened
+        gimbal = Mock(spec=Gimbal(Mock()))
+        gimbal.get_angles = Mock(return_value=GetAnglesInCmd(
+            imu_angle_1=0, target_angle_1=0, target_speed_1=0,
+            imu_angle_2=0, target_angle_2=0, target_speed_2=0,
+            imu_angle_3=0, target_angle_3=0, target_speed_3=0))
+        return gimbal
+
+    @pytest.fixture()
+    def camera_manager(self):
+        camera_manager = Mock()
+        camera_manager.camera = None
+        return camera_manager
+
+    @pytest.fixture()
+    def manager(self, gimbal, camera_manager):
+        camera_controller = SmoothCameraController(
+            gimbal,
+            camera_manager,
+            rotate_speed_manager=SpeedManager(),
+            tilt_speed_manager=SpeedManager())
+        return CameramanModeManager(
+            camera_controller=camera_controller,
+            camera_zoom_limit_controller=Mock(),
+            camera_angle_limit_controller=Mock(),
+            align_tracking_strategy=Mock(),
+            tracking_strategy=Mock(),
+            search_target_strategy=Mock(),
+            gimbal=gimbal,
+            event_emitter=EventEmitter())
+
+    def test_stop_after_angle_sends_speeds_again(self, manager, gimbal):
+        manager.start()
+        manager.update(target=None, is_target_lost=True)
+        gimbal.control.assert_called_once_with(yaw_speed=0, pitch_speed=0)
+        manager.angle(pan_angle=10, tilt_angle=20)
+        assert gimbal.control.call_count == 2
+        # gimbal moves to angle until it is stopped
+        manager.manual_mode()
+        manager.stop_camera()
+        manager.update(target=None, is_target_lost=True)
+        assert gimbal.control.call_count == 3
+        assert gimbal.control.call_args == call(yaw_speed=0, pitch_speed=0)
+
+    def test_stop_after_angle_during_update_sends_speeds_again(
+            self, manager, gimbal):
+        def control_angle_during_update(**_kwargs):
+            # the server thread controls the angle while the speeds are sent
+            gimbal.control.side_effect = None
+            manager.angle(pan_angle=10, tilt_angle=20)
+
+        manager.start()
+        gimbal.control.side_effect = control_angle_during_update
+        manager.update(target=None, is_target_lost=True)
+        assert gimbal.control.call_count == 2
+        manager.manual_mode()
+        manager.stop_camera()
+        manager.update(target=None, is_target_lost=True)
+        assert gimbal.control.call_count == 3
+        assert gimbal.control.call_args == call(yaw_speed=0, pitch_speed=0)
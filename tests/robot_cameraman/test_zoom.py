@@ -0,0 +1,22 @@
+import pytest
+
+from robot_cameraman.zoom import ZoomSteps, ZoomStep
+
+
+class TestZoomSteps:
+    @pytest.fixture()
+    def zoom_steps(self):
+        return ZoomSteps([ZoomStep(zoom_ratio=1.0, zoom_in_time=0),
+                          ZoomStep(zoom_ratio=1.5, zoom_in_time=0.5),
+                          ZoomStep(zoom_ratio=2.0, zoom_in_time=1.0)])
+
+    def test_get_by_zoom_ratio(self, zoom_steps):
+        assert zoom_steps.get_by_zoom_ratio(1.5).zoom_in_time == 0.5
+        assert zoom_steps.get_by_zoom_ratio(1.2) is None
+
+    def test_get_next_greater(self, zoom_steps):
+        zoom_step = zoom_steps.get_by_zoom_ratio(1.0)
+        assert zoom_steps.get_next_greater(zoom_step).zoom_ratio == 1.5
+        zoom_step = zoom_steps.get_by_zoom_ratio(2.0)
+        assert zoom_steps.get_next_greater(zoom_step) is None
+        assert zoom_steps.get_next_greater(None) is None